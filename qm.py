@@ -1,94 +1,82 @@
-from typing import Union
+from functools import lru_cache
+
+
+def _count_bits(value) -> int:
+    """Returns the amount of 1 bits in the specified value.
+
+    :param value: The integer to count the 1 bits of
+    :type value: int
+    """
+    return bin(value).count("1")
+
+
+# Count the bits directly when the Python version supports it (3.10+)
+if hasattr(int, "bit_count"):
+    _count_bits = int.bit_count
 
 
 class Minterm:
     """An object to hold information about a minterm/maxterm when using the Quine-McCluskey Algorithm
 
     :param values: The integer values that this Minterm consists of
-    :param value: The bit values of this Minterm
-        For example, a minterm could have bit values such as ('-010', '1010', '--00', etc.)
+    :param value: The bit values of this Minterm as an integer
+    :param mask: The bits of this Minterm that are dashes as an integer
+        For example, a minterm with bit values of '-010' has a value of 2 (0010) and a mask of 8 (1000)
+    :param width: The amount of bits in this Minterm
+    :param already_sorted: Whether or not the values are already in sorted order
 
     :type values: list
-    :type value: str
+    :type value: int
+    :type mask: int
+    :type width: int
+    :type already_sorted: bool
     """
 
-    def __init__(self, values, value):
-        self._values = values
-        self._value = value
-        self._used = False
+    __slots__ = ("_values", "_value", "_mask", "_width")
+
+    def __init__(self, values, value, mask, width, *, already_sorted=False):
 
-        self._values.sort()
+        # The values are kept in a tuple since Minterms are shared between
+        #   every QM that solves the same expression
+        self._values = tuple(values if already_sorted else sorted(values))
+        self._value = value & ~mask
+        self._mask = mask
+        self._width = width
 
     def __str__(self):
         values = ", ".join([str(value) for value in self._values])
-        return f"m({values}) = {self._value}"
+        return f"m({values}) = {self.get_value()}"
 
     def __eq__(self, minterm):
         if type(minterm) != Minterm:
             return False
 
         return (
-                self._value == minterm.get_value() and
-                self._values == minterm.get_values()
+                self._value == minterm._value and
+                self._mask == minterm._mask and
+                self._values == minterm._values
         )
 
-    def get_values(self) -> list:
+    def __hash__(self):
+        return hash((self._value, self._mask))
+
+    def get_values(self) -> tuple:
         """Returns all the implicants that this minterm covers."""
         return self._values
 
     def get_value(self) -> str:
         """Returns the bit values ('-010', '1010', etc.) for this minterm."""
-        return self._value
-
-    def use(self):
-        """Keeps track of when this minterm is "used" in a comparison."""
-        self._used = True
-
-    def used(self) -> bool:
-        """Returns whether or not this minterm was used."""
-        return self._used
-
-    def combine(self, minterm) -> Union['Minterm', 'None']:
-        """Combines this minterm with the specified minterm if possible.
-        If the two minterms cannot be combined, the minterms will not be "used"
-        and None will be returned.
-        If the two minterms can be combined, the minterms will be "used"
-        and the new minterm will be returned
-
-        :param minterm: A minterm to combine this minterm with
-        :type minterm: Minterm
-        """
-
-        # Check if this minterm is the same as the one trying to be combined with
-        if self._value == minterm._value or self._values == minterm._values:
-            return None
-
-        # Keep track of the amount of difference between the value of the minterm
-        #   and also keep track of the resulting string
-        diff = 0
-        result = ""
-
-        # Iterate through all the bit values
-        for char in range(len(self._value)):
-
-            # Check if this minterm and the combined minterm have a bit difference
-            if self._value[char] != minterm._value[char]:
-                diff += 1
-                result += "-"
-
-            # There is no difference
-            else:
-                result += self._value[char]
-
-            # The difference is greater than 1, these minterms cannot be combined
-            if diff > 1:
-                return None
-
-        return Minterm(self._values + minterm._values, result)
+        return "".join([
+            "-" if self._mask >> bit & 1 else str(self._value >> bit & 1)
+            for bit in range(self._width - 1, -1, -1)
+        ])
 
 
 class QM:
     """A class to handle processing the Quine-McCluskey Algorithm.
+    The prime implicants left after the essential prime implicants are chosen with a search
+    that stops after _COVER_BUDGET steps, so for large expressions the function
+    may use more prime implicants than the smallest possible set.
 
     :param variables: A list of variables (as strings), in alphabetical order, that an expression has
     :param values: A list of integers where the binary values evaluate to true at
@@ -101,6 +89,11 @@ class QM:
     :type is_maxterm: bool
     """
 
+    # The most search steps used to find the smallest set of prime implicants
+    #   An exact search can take exponential time, so after this many steps
+    #   the smallest set found so far is used instead
+    _COVER_BUDGET = 20000
+
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Initialize
     # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -111,57 +104,45 @@ class QM:
         self._variables = variables
         self._values = values
         self._dont_cares = dont_cares
-        self._all_values = values + dont_cares
         self._is_maxterm = is_maxterm
 
         self._function = self.__get_function()
 
-    # # # # # # # # # # # # # # # # # # # # # # # # #
-    # Helper Methods
-    # # # # # # # # # # # # # # # # # # # # # # # # #
-
-    def __get_bits(self, value) -> str:
-        """Returns the binary digit for the specified value.
-
-        :param value: The integer to get the binary digits of
-        :type value: int
-        """
-
-        # Pad the result with extra 0's at the beginning to match how many variables
-        # there are being used
-        return bin(value)[2:].rjust(len(self._variables), "0")
-
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Grouping Methods
     # # # # # # # # # # # # # # # # # # # # # # # # #
 
-    def __initial_group(self) -> list:
+    @staticmethod
+    def __initial_group(variable_count, all_values) -> list:
         """Creates the initial grouping for the bits from the values
         given to the Quine-McCluskey Algorithm
 
-        :return: A 2-dimensional list of groups in the Quine-McCluskey algorithm
-                 grouped by the amount of 1's bits in each integer value
-        """
+        :param variable_count: The amount of variables there are being used
+        :param all_values: The integer values and don't-care values to group
 
-        # Keep track of groups by 2-dimensional list
-        groups = []
-        for count in range(len(self._variables) + 1):
-            groups.append([])
+        :type variable_count: int
+        :type all_values: tuple[int]
 
-        # Iterate through values
-        for value in self._all_values:
-            # Count number of 1's in value's bit equivalent
-            count = self.__get_bits(value).count("1")
+        :return: A list of groups in the Quine-McCluskey algorithm
+                 grouped by the amount of 1's bits in each integer value.
+                 Each group is a tuple of 2 parallel lists holding the bit values
+                 and the dash masks of each term
+        """
 
-            # Add count to proper group
-            groups[count].append(Minterm([value], self.__get_bits(value)))
+        # Add each value to the group for the number of 1's in its bit equivalent
+        groups = [[] for _ in range(variable_count + 1)]
+        for value in all_values:
+            groups[_count_bits(value)].append(value)
 
-        return groups
+        # The initial values have no dashes
+        return [(values, [0] * len(values)) for values in groups]
 
     @staticmethod
-    def __power_set(values, prime_implicants):
-        """Creates a power set of all valid prime implicants that covers
+    def __minimum_cover(values, prime_implicants):
+        """Finds the smallest set of prime implicants that covers
         the rest of an expression. This is used after the essential prime implicants have been found.
+        If the search runs out of its _COVER_BUDGET steps, this is the smallest set found before then,
+        which is approximate and may not be the smallest set.
 
         :param values: The integer values that have already been evaluated
         :param prime_implicants: The list of prime implicants (minterms) that are necessary to evaluate the expression
@@ -170,139 +151,331 @@ class QM:
         :type prime_implicants: list[Minterm]
         """
 
-        # Get the power set of all the prime_implicants
-        prime_implicants = list(prime_implicants)
-        power_set = []
+        # Keep track of which prime implicants cover each value
+        value_coverers = {value: [] for value in values}
+        for index in range(len(prime_implicants)):
+            for value in prime_implicants[index].get_values():
+                if value in value_coverers:
+                    value_coverers[value].append(index)
+
+        # Keep track of the values each prime implicant covers as a bitmask
+        #   The values with the fewest prime implicants covering them get the lowest bits
+        #   so the search can always branch on the lowest uncovered bit
+        coverers = sorted(value_coverers.values(), key=len)
+        covers = [0] * len(prime_implicants)
+        for bit in range(len(coverers)):
+            for index in coverers[bit]:
+                covers[index] |= 1 << bit
+
+        # Keep track of every value that shares a prime implicant with each value
+        neighbors = [0] * len(coverers)
+        for bit in range(len(coverers)):
+            for index in coverers[bit]:
+                neighbors[bit] |= covers[index]
+
+        # Start with a greedy cover so the search has a set to beat
+        uncovered = (1 << len(values)) - 1
+        best = []
+        while uncovered:
+            index = max(range(len(covers)), key=lambda i: _count_bits(covers[i] & uncovered))
+            best.append(index)
+            uncovered &= ~covers[index]
+
+        # Find the smallest combination of prime implicants that covers every value
+        min_set = QM.__cover(covers, coverers, neighbors, (1 << len(values)) - 1, best)
+        return [prime_implicants[index] for index in sorted(min_set)]
 
-        # Iterate through decimal values from 1 to 2 ** size - 1
-        for i in range(1, 2 ** len(prime_implicants)):
-            current_set = []
+    @staticmethod
+    def __cover(covers, coverers, neighbors, uncovered, best):
+        """Searches for the smallest set of prime implicants that covers all the uncovered values.
+        This branches on the uncovered value in the lowest bit, which has the fewest prime implicants
+        covering it, and stops searching any branch that cannot be smaller than the best set found so far.
+        Once the search has taken _COVER_BUDGET steps, the best set found so far is kept,
+        which is at worst the greedy set, so it may not be the smallest.
+
+        :param covers: The bitmask of values that each prime implicant covers
+        :param coverers: The indexes of the prime implicants that cover the value in each bit
+        :param neighbors: The bitmask of values that share a prime implicant with the value in each bit
+        :param uncovered: The bitmask of values that need to be covered
+        :param best: The indexes of the smallest set of prime implicants found so far
+
+        :type covers: list[int]
+        :type coverers: list[list[int]]
+        :type neighbors: list[int]
+        :type uncovered: int
+        :type best: list[int]
+
+        :return: The indexes of the smallest set of prime implicants found
+        :rtype: list[int]
+        """
 
-            # Get the binary value of the decimal value
-            bin_value = bin(i)[2:].rjust(len(prime_implicants), "0")
+        # The fewest prime implicants chosen so far for each bitmask of uncovered values
+        visited = {}
+        steps_left = QM._COVER_BUDGET
+
+        # The search is run from a stack instead of recursing, since a branch can choose
+        #   as many prime implicants as the greedy set has, which may be more than Python's recursion limit
+        #   Each entry holds the uncovered values, the prime implicants left to try for them,
+        #   and the values covered by the ones already tried
+        #   The prime implicant chosen in each entry is at the same position in the chosen list
+        chosen = []
+        stack = []
+        while True:
+
+            # Every value is covered, this is the smallest set so far
+            if uncovered == 0:
+                best = list(chosen)
+
+            # These values were not already left uncovered with as few prime implicants chosen,
+            #   and the budget has not run out yet
+            elif visited.get(uncovered, len(best)) > len(chosen) and steps_left > 0:
+                steps_left -= 1
+                visited[uncovered] = len(chosen)
+
+                # Count how many uncovered values share no prime implicant with each other,
+                #   since each of those values needs its own prime implicant in the set
+                needed = 0
+                independent = uncovered
+                while independent:
+                    value = independent & -independent
+                    needed += 1
+                    independent &= ~neighbors[value.bit_length() - 1]
+
+                # One of the prime implicants covering the lowest uncovered value must be in the set,
+                #   so try each of them starting with the ones that cover the most uncovered values
+                #   unless the rest of the values need too many prime implicants to beat the best set
+                if len(chosen) + needed < len(best):
+                    candidates = coverers[(uncovered & -uncovered).bit_length() - 1]
+                    stack.append((
+                        uncovered,
+                        iter(sorted(candidates, key=lambda i: -_count_bits(covers[i] & uncovered))),
+                        []
+                    ))
+
+            # Move on to the next prime implicant to try
+            #   A prime implicant that only covers values another one also covers is skipped
+            uncovered = None
+            while stack and uncovered is None:
+                del chosen[len(stack) - 1:]
+                values, candidates, tried = stack[-1]
+                for index in candidates:
+                    cover = covers[index] & values
+                    if any(cover & ~other == 0 for other in tried):
+                        continue
+                    tried.append(cover)
+
+                    chosen.append(index)
+                    uncovered = values & ~cover
+                    break
+                else:
+                    stack.pop()
+
+            # Every branch has been searched
+            if uncovered is None:
+                return best
 
-            # Find which indexes have 1 in the bin_value string
-            for index in range(len(bin_value)):
-                if bin_value[index] == "1":
-                    current_set.append(prime_implicants[index])
-            power_set.append(current_set)
+    # # # # # # # # # # # # # # # # # # # # # # # # #
+    # Compare Methods
+    # # # # # # # # # # # # # # # # # # # # # # # # #
 
-        # Remove all subsets that do not cover the rest of the implicants
-        min_set = power_set[0]
-        for subset in power_set:
+    @staticmethod
+    def __get_minterm(variable_count, value, mask) -> Minterm:
+        """Creates the minterm for a term found by the Quine-McCluskey Algorithm.
+        The integer values a term covers are every value that matches its bit values
+        when its dashes are replaced with any combination of 0's and 1's, so they don't
+        need to be carried through every comparison.
 
-            # Get all the values the set covers
-            temp_values = []
-            for implicant in subset:
-                for value in implicant.get_values():
-                    if value not in temp_values and value in values:
-                        temp_values.append(value)
-            temp_values.sort()
+        :param variable_count: The amount of variables there are being used
+        :param value: The bit values of the term
+        :param mask: The dash mask of the term
 
-            # Check if this subset covers the rest of the values
-            if temp_values == values:
-                if len(subset) < len(min_set):
-                    min_set = subset
+        :type variable_count: int
+        :type value: int
+        :type mask: int
+        """
 
-        return min_set
+        # Step through every combination of the dash bits in increasing order
+        #   which keeps the covered values sorted
+        values = [value]
+        dashes = (0 - mask) & mask
+        while dashes:
+            values.append(value | dashes)
+            dashes = (dashes - mask) & mask
 
-    # # # # # # # # # # # # # # # # # # # # # # # # #
-    # Compare Methods
-    # # # # # # # # # # # # # # # # # # # # # # # # #
+        return Minterm(values, value, mask, variable_count, already_sorted=True)
 
-    def __get_prime_implicants(self, groups=None) -> list:
-        """Recursively gets the prime implicants for the expression.
+    @staticmethod
+    def __combine_groups(variable_count, values1, masks1, values2, masks2) -> list:
+        """Finds every pair of terms from two adjacent groups that can be combined.
+
+        Since every term in group2 has one more 1 bit than the terms in group1,
+        a term in group2 can only be combined with a term in group1 if it has the
+        same dash mask and the same bit values with one of the 0 bits set to 1.
+        Those terms are looked up directly instead of comparing every pair of terms.
+
+        :param variable_count: The amount of variables there are being used
+        :param values1: The bit values of the terms in group1
+        :param masks1: The dash masks of the terms in group1
+        :param values2: The bit values of the terms in group2
+        :param masks2: The dash masks of the terms in group2
+
+        :type variable_count: int
+        :type values1: list[int]
+        :type masks1: list[int]
+        :type values2: list[int]
+        :type masks2: list[int]
+
+        :return: The index in group1, the index in group2, and the differing bit
+                 of each pair of terms that can be combined, in the order the pairs
+                 would be found by comparing every term in group1 with every term in group2
+        :rtype: list[tuple[int, int, int]]
+        """
 
-        :param groups: A list of groups to retrieve the prime implicants for
-        :type groups: list
+        # Keep track of where each term in group2 is by its bit values and dash mask
+        #   The terms in a group are unique, so each key has only 1 index
+        indexes = dict(zip(zip(values2, masks2), range(len(values2))))
+        find = indexes.get
+
+        pairs = []
+        bits = (1 << variable_count) - 1
+        for i in range(len(values1)):
+            value = values1[i]
+            mask = masks1[i]
+            matches = []
+
+            # Try setting each 0 bit that is not a dash
+            remaining = bits & ~(value | mask)
+            while remaining:
+                diff = remaining & -remaining
+                remaining ^= diff
+                j = find((value | diff, mask))
+                if j is not None:
+                    matches.append((j, diff))
+
+            # Keep the pairs in the same order as comparing every term in group2
+            if len(matches) > 1:
+                matches.sort()
+            for j, diff in matches:
+                pairs.append((i, j, diff))
+
+        return pairs
 
-        :rtype: list[Minterm]
-        """
+    @staticmethod
+    def __get_prime_implicants(variable_count, all_values) -> dict:
+        """Gets the prime implicants for the expression by comparing
+        each round of groups until there are no groups left to compare.
 
-        # Get initial group if group is None
-        if groups is None:
-            groups = self.__initial_group()
+        Each group is compared as bit slices: two terms can be combined only if
+        their dash masks are the same and their bit values differ by exactly one bit.
 
-        # If there is only 1 group, return all the minterms in it
-        if len(groups) == 1:
-            return groups[0]
+        :param variable_count: The amount of variables there are being used
+        :param all_values: The integer values and don't-care values to get the prime implicants for
 
-        # Try comparing the rest
-        else:
-            unused = []
+        :type variable_count: int
+        :type all_values: tuple[int]
+
+        :return: The prime implicants keyed by their bit values and dash masks
+        :rtype: dict[tuple[int, int], Minterm]
+        """
+
+        groups = QM.__initial_group(variable_count, all_values)
+        unused = {}
+
+        # Keep comparing until there are no groups left
+        #   The last group has nothing to compare with, so all of its minterms are unused
+        while groups:
             comparisons = range(len(groups) - 1)
-            new_groups = [[] for _ in comparisons]
+            new_groups = [([], []) for _ in comparisons]
+            used = [[False] * len(group[0]) for group in groups]
 
             for compare in comparisons:
-                group1 = groups[compare]
-                group2 = groups[compare + 1]
-
-                # Compare every term in group1 with every term in group2
-                for term1 in group1:
-                    for term2 in group2:
-
-                        # Try combining it
-                        term3 = term1.combine(term2)
-
-                        # Only add it to the new group if term3 is not None
-                        #   term3 will only be None if term1 and term2 could not
-                        #   be combined
-                        if term3 is not None:
-                            term1.use()
-                            term2.use()
-                            if term3 not in new_groups[compare]:
-                                new_groups[compare].append(term3)
-
-            # Get list of all unused minterms
-            for group in groups:
-                for term in group:
-                    if not term.used() and term not in unused:
-                        unused.append(term)
-
-            # Add recursive call
-            for term in self.__get_prime_implicants(new_groups):
-                if not term.used() and term not in unused:
-                    unused.append(term)
-
-            return unused
+                values1, masks1 = groups[compare]
+                values2, masks2 = groups[compare + 1]
+                new_values, new_masks = new_groups[compare]
+                seen = set()
+
+                # Nothing can be combined if either group is empty
+                if not values1 or not values2:
+                    continue
+
+                for i, j, diff in QM.__combine_groups(variable_count, values1, masks1, values2, masks2):
+                    used[compare][i] = True
+                    used[compare + 1][j] = True
+
+                    # Replace the differing bit with a dash
+                    value = values1[i] & ~diff
+                    mask = masks1[i] | diff
+                    if (value, mask) not in seen:
+                        seen.add((value, mask))
+                        new_values.append(value)
+                        new_masks.append(mask)
+
+            # Get all unused minterms, keyed by their bit values and dash masks
+            for index in range(len(groups)):
+                values, masks = groups[index]
+                for term in range(len(values)):
+                    key = (values[term], masks[term])
+                    if not used[index][term] and key not in unused:
+                        unused[key] = QM.__get_minterm(variable_count, values[term], masks[term])
+
+            groups = new_groups
+
+        return unused
 
     # # # # # # # # # # # # # # # # # # # # # # # # #
     # Solving Methods
     # # # # # # # # # # # # # # # # # # # # # # # # #
 
-    def __solve(self) -> list:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __solve(variable_count, values, dont_cares) -> tuple:
         """Solves for the expression returning the minimal amount of prime implicants needed
         to cover the expression.
+        The result is cached so that the same truth table is only ever solved once.
+
+        :param variable_count: The amount of variables there are being used
+        :param values: The sorted integer values where the expression evaluates to true at
+        :param dont_cares: The sorted integer values to be used as don't-care values
 
-        :rtype: list[Minterm]
+        :type variable_count: int
+        :type values: tuple[int]
+        :type dont_cares: tuple[int]
+
+        :rtype: tuple[Minterm]
         """
 
         # Get the prime implicants
-        prime_implicants = self.__get_prime_implicants(self.__initial_group())
+        prime_implicants = list(QM.__get_prime_implicants(variable_count, values + dont_cares).values())
+
+        # Keep track of which prime implicants cover each value
+        #   and where each value is so it can be marked as used
+        #   Any value that is not in the indexes is a don't-care value
+        coverers = {}
+        for prime_implicant in prime_implicants:
+            for value in prime_implicant.get_values():
+                coverers.setdefault(value, []).append(prime_implicant)
+        indexes = {values[index]: index for index in range(len(values))}
 
         # Keep track of values with only 1 implicant
         #   These are the essential prime implicants
+        #   The set checks whether an implicant is already essential without scanning the list
         essential_prime_implicants = []
-        values_used = [False] * len(self._values)
-
-        for i in range(len(self._values)):
-            value = self._values[i]
-
-            uses = 0
-            last = None
-            for minterm in prime_implicants:
-                if value in minterm.get_values():
-                    uses += 1
-                    last = minterm
-            if uses == 1 and last not in essential_prime_implicants:
-                for v in last.get_values():
-                    if v not in self._dont_cares:
-                        values_used[self._values.index(v)] = True
-                essential_prime_implicants.append(last)
+        essential_set = set()
+        values_used = bytearray(len(values))
+
+        for value in values:
+            if len(coverers[value]) == 1:
+                last = coverers[value][0]
+                if last not in essential_set:
+                    for v in last.get_values():
+                        if v in indexes:
+                            values_used[indexes[v]] = True
+                    essential_prime_implicants.append(last)
+                    essential_set.add(last)
 
         # Check if all values were used
-        if values_used.count(False) == 0:
-            return essential_prime_implicants
+        if all(values_used):
+            return tuple(essential_prime_implicants)
 
         # Keep track of prime implicants that cover as many values as possible
         #   with as few variables as possible
@@ -310,66 +483,66 @@ class QM:
             prime_implicant
             for prime_implicant in prime_implicants
             if (
-                    prime_implicant not in essential_prime_implicants and
-                    len([value for value in prime_implicant.get_values() if value not in self._dont_cares]) > 0
+                    prime_implicant not in essential_set and
+                    any(value in indexes for value in prime_implicant.get_values())
             )
         ]
 
         # Check if there is only one implicant left (very rare but just in case)
         if len(prime_implicants) == 1:
-            return essential_prime_implicants + prime_implicants
+            return tuple(essential_prime_implicants + prime_implicants)
 
-        # Create a power set from the remaining prime implicants and check which
-        #   combination of prime implicants gets the simplest form
-        return essential_prime_implicants + self.__power_set([
-            self._values[index]
-            for index in range(len(self._values))
+        # Search the remaining prime implicants for the smallest
+        #   combination of prime implicants that covers the rest of the values
+        return tuple(essential_prime_implicants + QM.__minimum_cover([
+            values[index]
+            for index in range(len(values))
             if not values_used[index]
-        ], prime_implicants)
+        ], prime_implicants))
 
     def __get_function(self) -> str:
         """Returns the expression in readable form."""
 
         # Get the prime implicants and variables
-        prime_implicants = self.__solve()
+        #   The values are sorted so that the same truth table always
+        #   shares the same cached solution
+        #   A value that is also a don't-care value still needs to be covered
+        variable_count = len(self._variables)
+        values = set(self._values)
+        prime_implicants = QM.__solve(
+            variable_count, tuple(sorted(values)), tuple(sorted(set(self._dont_cares) - values))
+        )
 
         # Check if there are no prime_implicants; Always False
         if len(prime_implicants) == 0:
             return "0"
 
-        if len(prime_implicants) == 1:
-            if prime_implicants[0].get_value().count("-") == len(self._variables):
-                return "1"
-
-        result = ""
+        # Get the bit values of each implicant once
+        bit_values = [implicant.get_value() for implicant in prime_implicants]
 
-        # Iterate through prime implicants
-        for j in range(len(prime_implicants)):
-            implicant = prime_implicants[j]
+        if len(bit_values) == 1:
+            if bit_values[0].count("-") == variable_count:
+                return "1"
 
-            # Add parentheses if necessary
-            if implicant.get_value().count("-") < len(self._variables):
-                result += "("
-
-            # Iterate through all bits in the implicants value
-            for i in range(len(implicant.get_value())):
-                if implicant.get_value()[i] == ("0" if not self._is_maxterm else "1"):
-                    result += "NOT "
-                if implicant.get_value()[i] != "-":
-                    result += self._variables[i]
-                if implicant.get_value().count("-", i + 1) < len(implicant.get_value()) - i - 1 and \
-                        implicant.get_value()[i] != "-":
-                    result += " AND " if not self._is_maxterm else " OR "
+        # Keep track of which bit negates a variable, which operator joins
+        #   the variables of an implicant, and which operator joins the implicants
+        negated = "0" if not self._is_maxterm else "1"
+        inner = " AND " if not self._is_maxterm else " OR "
+        outer = " OR " if not self._is_maxterm else " AND "
+
+        # Build each implicant from the variables that are not dashes
+        clauses = []
+        for value in bit_values:
+            literals = [
+                ("NOT " if value[i] == negated else "") + self._variables[i]
+                for i in range(len(value))
+                if value[i] != "-"
+            ]
 
             # Add parentheses if necessary
-            if implicant.get_value().count("-") < len(self._variables):
-                result += ")"
-
-            # Combine all minterm expressions with an OR operator
-            if j < len(prime_implicants) - 1:
-                result += " OR " if not self._is_maxterm else " AND "
+            clauses.append(f"({inner.join(literals)})" if literals else "")
 
-        return result
+        return outer.join(clauses)
 
     def get_function(self) -> str:
         """Returns the function solved by the Quine-McCluskey Algorithm"""